@@ -9,6 +9,7 @@ import itertools
 import os
 from pathlib import Path
 import re
+import sys
 import typing as t
 from urllib.parse import (
     quote_plus,
@@ -284,8 +285,10 @@ def _get_query_metrics(
 ) -> list[QueryMetric]:
     """Return QueryMetrics for a query."""
 
-    def _metric_labels(labels: t.Iterable[str]) -> list[str]:
-        return sorted(set(labels) - extra_labels)
+    def _metric_labels(labels: t.Iterable[str]) -> tuple[str, ...]:
+        return tuple(
+            sys.intern(label) for label in sorted(set(labels) - extra_labels)
+        )
 
     return [
         QueryMetric(name, _metric_labels(metrics[name].labels))
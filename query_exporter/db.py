@@ -2,31 +2,36 @@
 
 import asyncio
 from collections.abc import (
+    Awaitable,
     Callable,
     Iterable,
+    Mapping,
     Sequence,
 )
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import (
     dataclass,
     field,
 )
-from functools import partial
-from itertools import chain
-from threading import (
-    Thread,
-    current_thread,
+from functools import (
+    lru_cache,
+    partial,
 )
+from itertools import chain
+from operator import itemgetter
 from time import (
     perf_counter,
     time,
 )
-from types import TracebackType
+from types import (
+    MappingProxyType,
+    TracebackType,
+)
 import typing as t
 
 from croniter import croniter
 from sqlalchemy import (
     create_engine,
-    event,
     text,
 )
 from sqlalchemy.engine import (
@@ -38,16 +43,30 @@ from sqlalchemy.exc import (
     ArgumentError,
     NoSuchModuleError,
 )
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+)
 from sqlalchemy.sql.elements import TextClause
 import structlog
 
+from .log import is_debug_enabled
+
 #: Timeout for a query
 QueryTimeout = int | float
 
+_T = t.TypeVar("_T")
+
 
 #: Label used to tag metrics by database
 DATABASE_LABEL = "database"
 
+#: Labels for metric results without labels, shared across results
+EMPTY_LABELS: Mapping[str, str] = MappingProxyType({})
+
+# Parameters for queries that don't take any
+_EMPTY_PARAMETERS: Mapping[str, t.Any] = MappingProxyType({})
+
 
 class DataBaseError(Exception):
     """A databease error.
@@ -147,30 +166,99 @@ def create_db_engine(dsn: str, **kwargs: t.Any) -> Engine:
         raise DataBaseError(f'Invalid database DSN: "{dsn}"')
 
 
+@lru_cache(maxsize=128)
+def _is_valid_schedule(schedule: str) -> bool:
+    """Return whether a cron schedule is valid.
+
+    Results are cached as queries often share the same schedule.
+
+    """
+    return bool(croniter.is_valid(schedule))
+
+
+def _labels_getter(
+    indexes: list[int],
+) -> Callable[[Sequence[t.Any]], Sequence[t.Any]] | None:
+    """Return a getter for values at indexes from a row, as a sequence."""
+    if not indexes:
+        return None
+    if len(indexes) == 1:
+        # itemgetter returns a single value rather than a tuple in this case
+        index = indexes[0]
+        return itemgetter(slice(index, index + 1))
+    return itemgetter(*indexes)
+
+
+@lru_cache(maxsize=256)
+def _sql_text(sql: str) -> TextClause:
+    """Return a text clause for SQL.
+
+    Clauses are cached since the same raw SQL is run repeatedly, e.g. the
+    connect SQL run every time a database connects.
+
+    """
+    return text(sql)
+
+
+@lru_cache(maxsize=256)
+def _sql_params(sql: str) -> frozenset[str]:
+    """Return names of parameters in SQL.
+
+    Results are cached since queries with multiple parameters sets share
+    the same SQL.
+
+    """
+    return frozenset(_sql_text(sql).compile().params)
+
+
 class QueryMetric(t.NamedTuple):
     """Metric details for a Query."""
 
     name: str
-    labels: Iterable[str]
+    labels: tuple[str, ...]
+
+
+@lru_cache(maxsize=256)
+def _metrics_keys(
+    metrics: tuple[QueryMetric, ...],
+) -> tuple[frozenset[str], frozenset[str]]:
+    """Return labels and all expected result keys for query metrics.
+
+    Results are cached since queries with multiple parameters sets, as well
+    as queries reloaded from the same configuration, share the same metrics.
+
+    """
+    labels: frozenset[str] = frozenset().union(
+        *(metric.labels for metric in metrics)
+    )
+    return labels, frozenset(metric.name for metric in metrics) | labels
 
 
 class QueryResults(t.NamedTuple):
     """Results of a database query."""
 
-    keys: list[str]
+    keys: tuple[str, ...]
     rows: Sequence[Sequence[t.Any]]
     timestamp: float | None = None
     latency: float | None = None
 
     @classmethod
-    def from_result(cls, result: CursorResult[t.Any]) -> t.Self:
+    def from_result(
+        cls,
+        result: CursorResult[t.Any],
+        timestamp: float | None = None,
+        latency: float | None = None,
+    ) -> t.Self:
         """Return a QueryResults from results for a query."""
-        timestamp = time()
-        keys: list[str] = []
-        rows: Sequence[Sequence[t.Any]] = []
+        if timestamp is None:
+            timestamp = time()
+        keys: tuple[str, ...] = ()
+        rows: Sequence[Sequence[t.Any]] = ()
         if result.returns_rows:
-            keys, rows = list(result.keys()), result.all()
-        latency = result.connection.info.get("query_latency", None)
+            # plain tuples are faster to index than Row objects
+            keys, rows = tuple(result.keys()), [tuple(row) for row in result]
+        else:
+            result.close()
         return cls(keys, rows, timestamp=timestamp, latency=latency)
 
 
@@ -179,7 +267,7 @@ class MetricResult(t.NamedTuple):
 
     metric: str
     value: t.Any
-    labels: dict[str, str]
+    labels: Mapping[str, str]
 
 
 class MetricResults(t.NamedTuple):
@@ -190,7 +278,17 @@ class MetricResults(t.NamedTuple):
     latency: float | None = None
 
 
-@dataclass
+# Plan for extracting a metric from a result row: metric name, value index,
+# label names and a getter for label values, if the metric has labels
+_MetricPlan = tuple[
+    str,
+    int,
+    tuple[str, ...],
+    Callable[[Sequence[t.Any]], Sequence[t.Any]] | None,
+]
+
+
+@dataclass(slots=True)
 class Query:
     """Query definition and configuration."""
 
@@ -198,15 +296,35 @@ class Query:
     databases: list[str]
     metrics: list[QueryMetric]
     sql: str
-    parameters: dict[str, t.Any] = field(default_factory=dict)
+    parameters: Mapping[str, t.Any] = field(default_factory=dict)
     timeout: QueryTimeout | None = None
     interval: int | None = None
     schedule: str | None = None
     config_name: str = ""
 
+    _labels: frozenset[str] = field(init=False, repr=False, compare=False)
+    _text_clause: TextClause = field(init=False, repr=False, compare=False)
+    _expected_keys: frozenset[str] = field(
+        init=False, repr=False, compare=False
+    )
+    _results_plan: tuple[tuple[str, ...], list[_MetricPlan]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         if not self.config_name:
             self.config_name = self.name
+        # parameters are passed as is on every execution, make them read-only
+        self.parameters = MappingProxyType(dict(self.parameters))
+        # labels might be passed as lists, normalize them as tuples so that
+        # metrics are hashable
+        self.metrics = [
+            QueryMetric(metric.name, tuple(metric.labels))
+            for metric in self.metrics
+        ]
+        self._labels, self._expected_keys = _metrics_keys(tuple(self.metrics))
+        # queries with different parameters sets share the same clause
+        self._text_clause = _sql_text(self.sql)
         self._check_schedule()
         self._check_query_parameters()
 
@@ -215,94 +333,142 @@ class Query:
         """Whether the query is run periodically via interval or schedule."""
         return bool(self.interval or self.schedule)
 
+    @property
+    def text_clause(self) -> TextClause:
+        """The SQL text clause for the query."""
+        return self._text_clause
+
     def labels(self) -> frozenset[str]:
         """Resturn all labels for metrics in the query."""
-        return frozenset(chain(*(metric.labels for metric in self.metrics)))
+        return self._labels
 
     def results(self, query_results: QueryResults) -> MetricResults:
         """Return MetricResults from a query."""
-        if not query_results.rows:
+        return self._metric_results(
+            query_results.keys,
+            query_results.rows,
+            timestamp=query_results.timestamp,
+            latency=query_results.latency,
+        )
+
+    def stream_results(
+        self,
+        result: CursorResult[t.Any],
+        timestamp: float | None = None,
+        latency: float | None = None,
+    ) -> MetricResults:
+        """Return MetricResults reading rows directly from a query result.
+
+        This avoids storing all rows from the result.
+
+        """
+        if not result.returns_rows:
+            result.close()
             return MetricResults([])
 
-        result_keys = sorted(query_results.keys)
-        labels = self.labels()
-        metrics = [metric.name for metric in self.metrics]
-        expected_keys = sorted(set(metrics) | labels)
-        if len(expected_keys) != len(result_keys):
-            raise InvalidResultCount(len(expected_keys), len(result_keys))
-        if result_keys != expected_keys:
-            raise InvalidResultColumnNames(expected_keys, result_keys)
-        results = []
-        for row in query_results.rows:
-            values = dict(zip(query_results.keys, row))
-            for metric in self.metrics:
-                metric_result = MetricResult(
-                    metric.name,
-                    values[metric.name],
-                    {label: values[label] for label in metric.labels},
-                )
-                results.append(metric_result)
+        return self._metric_results(
+            tuple(result.keys()), result, timestamp=timestamp, latency=latency
+        )
 
-        return MetricResults(
-            results,
-            timestamp=query_results.timestamp,
-            latency=query_results.latency,
+    def _metric_results(
+        self,
+        keys: tuple[str, ...],
+        rows: Iterable[Sequence[t.Any]],
+        timestamp: float | None = None,
+        latency: float | None = None,
+    ) -> MetricResults:
+        rows = iter(rows)
+        first_row = next(rows, None)
+        if first_row is None:
+            return MetricResults([])
+
+        metrics_plan = self._get_results_plan(keys)
+        # bind names locally, as they're used in a tight loop. Results are
+        # created via tuple.__new__, skipping the generated MetricResult
+        # constructor, which only adds a Python-level call
+        new, metric_result, empty_labels = (
+            tuple.__new__,
+            MetricResult,
+            EMPTY_LABELS,
         )
+        if not self._labels:
+            # no metric has labels, all share the empty labels mapping
+            results = [
+                new(metric_result, (name, row[value_index], empty_labels))
+                for row in chain((first_row,), rows)
+                for name, value_index, _, _ in metrics_plan
+            ]
+            return MetricResults(results, timestamp=timestamp, latency=latency)
+
+        results = [
+            new(
+                metric_result,
+                (
+                    name,
+                    row[value_index],
+                    dict(zip(label_names, labels_getter(row)))
+                    if labels_getter
+                    else empty_labels,
+                ),
+            )
+            for row in chain((first_row,), rows)
+            for name, value_index, label_names, labels_getter in metrics_plan
+        ]
+        return MetricResults(results, timestamp=timestamp, latency=latency)
+
+    def _get_results_plan(self, keys: tuple[str, ...]) -> list[_MetricPlan]:
+        """Return the plan to extract metrics from rows with the given keys.
+
+        The plan for the last seen keys is cached, as they're normally the
+        same at every execution.
+
+        """
+        # the query can be run on multiple databases from different threads,
+        # read the cached plan once so it's not swapped while checking it
+        cached_plan = self._results_plan
+        if cached_plan is not None and cached_plan[0] == keys:
+            return cached_plan[1]
+
+        expected_keys = self._expected_keys
+        if len(expected_keys) != len(keys):
+            raise InvalidResultCount(len(expected_keys), len(keys))
+        if frozenset(keys) != expected_keys:
+            raise InvalidResultColumnNames(sorted(expected_keys), sorted(keys))
+        # resolve column indexes once, rows are then accessed by position
+        indexes = {key: index for index, key in enumerate(keys)}
+        plan = [
+            (
+                metric.name,
+                indexes[metric.name],
+                metric.labels,
+                _labels_getter([indexes[label] for label in metric.labels]),
+            )
+            for metric in self.metrics
+        ]
+        self._results_plan = (keys, plan)
+        return plan
 
     def _check_schedule(self) -> None:
         if self.interval and self.schedule:
             raise InvalidQuerySchedule(
                 self.name, "both interval and schedule specified"
             )
-        if self.schedule and not croniter.is_valid(self.schedule):
+        if self.schedule and not _is_valid_schedule(self.schedule):
             raise InvalidQuerySchedule(self.name, "invalid schedule format")
 
     def _check_query_parameters(self) -> None:
-        expr = text(self.sql)
-        query_params = set(expr.compile().params)
-        if set(self.parameters) != query_params:
+        if not self.parameters and ":" not in self.sql:
+            # no parameters can be referenced in the query
+            return
+        if self.parameters.keys() != _sql_params(self.sql):
             raise InvalidQueryParameters(self.name)
 
 
-class WorkerAction:
-    """An action to be called in the worker thread."""
-
-    def __init__(
-        self, func: Callable[..., t.Any], *args: t.Any, **kwargs: t.Any
-    ) -> None:
-        self._func = partial(func, *args, **kwargs)
-        self._loop = asyncio.get_event_loop()
-        self._future = self._loop.create_future()
-
-    def __str__(self) -> str:
-        return self._func.func.__name__
-
-    __repr__ = __str__
-
-    def __call__(self) -> None:
-        """Call the action asynchronously in a thread-safe way."""
-        try:
-            result = self._func()
-        except Exception as e:
-            self._call_threadsafe(self._future.set_exception, e)
-        else:
-            self._call_threadsafe(self._future.set_result, result)
-
-    async def result(self) -> t.Any:
-        """Wait for completion and return the action result."""
-        return await self._future
-
-    def _call_threadsafe(
-        self, call: Callable[..., t.Any], *args: t.Any
-    ) -> None:
-        self._loop.call_soon_threadsafe(partial(call, *args))
-
-
 class DataBaseConnection:
     """A connection to a database engine."""
 
     _conn: Connection | None = None
-    _worker: Thread | None = None
+    _executor: ThreadPoolExecutor | None = None
 
     def __init__(
         self,
@@ -313,8 +479,8 @@ class DataBaseConnection:
         self.dbname = dbname
         self.engine = engine
         self.logger = logger or structlog.get_logger()
-        self._loop = asyncio.get_event_loop()
-        self._queue: asyncio.Queue[WorkerAction] = asyncio.Queue()
+        self._debug_enabled = is_debug_enabled(self.logger)
+        self._loop = asyncio.get_running_loop()
 
     @property
     def connected(self) -> bool:
@@ -326,7 +492,10 @@ class DataBaseConnection:
         if self.connected:
             return
 
-        self._create_worker()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"DataBase-{self.dbname}"
+        )
+        self.logger.debug("start")
         await self._call_in_thread(self._connect)
 
     async def close(self) -> None:
@@ -335,79 +504,219 @@ class DataBaseConnection:
             return
 
         await self._call_in_thread(self._close)
-        self._terminate_worker()
+        t.cast(ThreadPoolExecutor, self._executor).shutdown(wait=True)
+        self._executor = None
+        self.logger.debug("shutdown")
 
     async def execute(
         self,
         sql: TextClause,
-        parameters: dict[str, t.Any] | None = None,
+        parameters: Mapping[str, t.Any] = _EMPTY_PARAMETERS,
     ) -> QueryResults:
         """Execute a query, returning results."""
-        if parameters is None:
-            parameters = {}
-        result = await self._call_in_thread(self._execute, sql, parameters)
         query_results: QueryResults = await self._call_in_thread(
-            QueryResults.from_result, result
+            self._execute_and_fetch, sql, parameters
         )
         return query_results
 
-    def _create_worker(self) -> None:
-        assert not self._worker
-        self._worker = Thread(
-            target=self._run, name=f"DataBase-{self.dbname}", daemon=True
+    async def execute_query(self, query: Query) -> MetricResults:
+        """Execute a Query, returning metric results."""
+        metric_results: MetricResults = await self._call_in_thread(
+            self._execute_query, query
         )
-        self._worker.start()
+        return metric_results
 
-    def _terminate_worker(self) -> None:
-        assert self._worker
-        self._worker.join()
-        self._worker = None
+    async def execute_many(self, sqls: Sequence[str]) -> None:
+        """Execute multiple queries in order, discarding results."""
+        await self._call_in_thread(self._execute_many, sqls)
 
     def _connect(self) -> None:
         self._conn = self.engine.connect()
 
-    def _execute(
-        self, sql: TextClause, parameters: dict[str, t.Any]
-    ) -> CursorResult[t.Any]:
-        assert self._conn
-        return self._conn.execute(sql, parameters)
+    def _execute_and_fetch(
+        self, sql: TextClause, parameters: Mapping[str, t.Any]
+    ) -> QueryResults:
+        # results are fetched in the same call, as the cursor is bound to the
+        # connection in the worker thread
+        conn = t.cast(Connection, self._conn)
+        timestamp, start = time(), perf_counter()
+        result = conn.execute(sql, parameters)
+        latency = perf_counter() - start
+        return QueryResults.from_result(
+            result, timestamp=timestamp, latency=latency
+        )
+
+    def _execute_query(self, query: Query) -> MetricResults:
+        # metric results are built from rows in the worker thread, without
+        # copying them first
+        conn = t.cast(Connection, self._conn)
+        timestamp, start = time(), perf_counter()
+        # server-side cursors are not used, as some drivers (e.g. psycopg2)
+        # don't support them in autocommit mode. With buffered results, the
+        # latency also covers fetching rows from the database
+        result = conn.execute(query.text_clause, query.parameters)
+        latency = perf_counter() - start
+        try:
+            return query.stream_results(
+                result, timestamp=timestamp, latency=latency
+            )
+        finally:
+            result.close()
+
+    def _execute_many(self, sqls: Sequence[str]) -> None:
+        conn = t.cast(Connection, self._conn)
+        for sql in sqls:
+            try:
+                conn.execute(_sql_text(sql))
+            except Exception as error:
+                raise DataBaseQueryError(
+                    f'failed executing query "{sql}": {error}'
+                )
 
     def _close(self) -> None:
-        assert self._conn
-        self._conn.detach()
-        self._conn.close()
+        conn = t.cast(Connection, self._conn)
+        conn.detach()
+        conn.close()
         self._conn = None
 
-    def _run(self) -> None:
-        """The worker thread function."""
-        logger = self.logger.bind(worker_id=current_thread().native_id)
-        logger.debug("start")
-        while True:
-            future = asyncio.run_coroutine_threadsafe(
-                self._queue.get(), self._loop
-            )
-            action = future.result()
-            logger.debug("action received", action=str(action))
-            action()
-            self._loop.call_soon_threadsafe(self._queue.task_done)
-            if self._conn is None:
-                # the connection has been closed, exit the thread
-                logger.debug("shutdown")
-                return
-
     async def _call_in_thread(
         self, func: Callable[..., t.Any], *args: t.Any, **kwargs: t.Any
     ) -> t.Any:
         """Call a sync action in the worker thread."""
-        call = WorkerAction(func, *args, **kwargs)
-        await self._queue.put(call)
-        return await call.result()
+        if self._debug_enabled:
+            self.logger.debug("action received", action=func.__name__)
+        if kwargs:
+            func = partial(func, **kwargs)
+        return await self._loop.run_in_executor(self._executor, func, *args)
+
+
+class AsyncDataBaseConnection:
+    """A connection to a database engine using an asyncio driver.
+
+    Queries are run directly in the event loop, without the need for a
+    worker thread.
+
+    """
+
+    _conn: AsyncConnection | None = None
+
+    def __init__(
+        self,
+        dbname: str,
+        engine: Engine,
+        logger: structlog.stdlib.BoundLogger | None = None,
+    ) -> None:
+        self.dbname = dbname
+        self.engine = engine
+        self.logger = logger or structlog.get_logger()
+        self._async_engine = AsyncEngine(engine)
+        # tasks closing discarded connections
+        self._discard_tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def connected(self) -> bool:
+        """Whether the connection is open."""
+        return self._conn is not None
+
+    async def open(self) -> None:
+        """Open the connection."""
+        if self.connected:
+            return
+
+        # wait for discarded connections to be closed before opening a new
+        # one, as the pool might reuse the underlying connection
+        await asyncio.gather(*self._discard_tasks, return_exceptions=True)
+        self._conn = await self._async_engine.connect()
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self.connected:
+            conn = t.cast(AsyncConnection, self._conn)
+            self._conn = None
+            await conn.close()
+        # wait for discarded connections to be closed as well
+        await asyncio.gather(*self._discard_tasks, return_exceptions=True)
+        # ensure connections are actually closed rather than kept in the pool,
+        # as they're bound to the current event loop
+        await self._async_engine.dispose()
+
+    async def execute(
+        self,
+        sql: TextClause,
+        parameters: Mapping[str, t.Any] = _EMPTY_PARAMETERS,
+    ) -> QueryResults:
+        """Execute a query, returning results."""
+        conn = t.cast(AsyncConnection, self._conn)
+        try:
+            timestamp, start = time(), perf_counter()
+            result = await conn.execute(sql, parameters)
+            latency = perf_counter() - start
+        except BaseException:
+            self._discard()
+            raise
+        return QueryResults.from_result(
+            result, timestamp=timestamp, latency=latency
+        )
+
+    async def execute_query(self, query: Query) -> MetricResults:
+        """Execute a Query, returning metric results."""
+        conn = t.cast(AsyncConnection, self._conn)
+        try:
+            timestamp, start = time(), perf_counter()
+            result = await conn.execute(query.text_clause, query.parameters)
+            latency = perf_counter() - start
+        except BaseException:
+            self._discard()
+            raise
+        return query.stream_results(
+            result, timestamp=timestamp, latency=latency
+        )
+
+    async def execute_many(self, sqls: Sequence[str]) -> None:
+        """Execute multiple queries in order, discarding results."""
+        conn = t.cast(AsyncConnection, self._conn)
+        for sql in sqls:
+            try:
+                await conn.execute(_sql_text(sql))
+            except Exception as error:
+                self._discard()
+                raise DataBaseQueryError(
+                    f'failed executing query "{sql}": {error}'
+                )
+            except BaseException:
+                self._discard()
+                raise
+
+    def _discard(self) -> None:
+        """Discard the connection after a failure or cancellation.
+
+        The connection might be left in an invalid state (e.g. with a
+        transaction that can't be rolled back), so it's invalidated and the
+        next query opens a new one.
+
+        Since the driver might still be running the query, the connection is
+        closed in background.
+
+        """
+        conn = t.cast(AsyncConnection, self._conn)
+        self._conn = None
+        task = asyncio.get_running_loop().create_task(
+            self._close_invalid(conn)
+        )
+        self._discard_tasks.add(task)
+        task.add_done_callback(self._discard_tasks.discard)
+
+    async def _close_invalid(self, conn: AsyncConnection) -> None:
+        try:
+            await conn.invalidate()
+        finally:
+            await conn.close()
 
 
 class DataBase:
     """A database to perform Queries."""
 
-    _conn: DataBaseConnection
+    _conn: DataBaseConnection | AsyncDataBaseConnection
     _pending_queries: int = 0
 
     def __init__(
@@ -419,6 +728,7 @@ class DataBase:
         if logger is None:
             logger = structlog.get_logger()
         self.logger = logger.bind(database=self.config.name)
+        self._debug_enabled = is_debug_enabled(self.logger)
         self._connect_lock = asyncio.Lock()
         execution_options = {}
         if self.config.autocommit:
@@ -427,8 +737,12 @@ class DataBase:
             self.config.dsn,
             execution_options=execution_options,
         )
-        self._conn = DataBaseConnection(self.config.name, engine, self.logger)
-        self._setup_query_latency_tracking(engine)
+        connection_class = (
+            AsyncDataBaseConnection
+            if engine.dialect.is_async
+            else DataBaseConnection
+        )
+        self._conn = connection_class(self.config.name, engine, self.logger)
 
     async def __aenter__(self) -> t.Self:
         await self.connect()
@@ -459,15 +773,14 @@ class DataBase:
                 raise self._db_error(error, exc_class=DataBaseConnectError)
 
             self.logger.debug("connected")
-            for sql in self.config.connect_sql:
-                try:
-                    await self.execute_sql(sql)
-                except Exception as error:
-                    await self._close()
-                    raise self._db_error(
-                        f'failed executing query "{sql}": {error}',
-                        exc_class=DataBaseQueryError,
-                    )
+            if not self.config.connect_sql:
+                return
+            try:
+                # run all statements in a single call to the connection
+                await self._conn.execute_many(self.config.connect_sql)
+            except Exception as error:
+                await self._close()
+                raise self._db_error(error, exc_class=DataBaseQueryError)
 
     async def close(self) -> None:
         """Close the database connection."""
@@ -478,14 +791,17 @@ class DataBase:
 
     async def execute(self, query: Query) -> MetricResults:
         """Execute a query."""
-        await self.connect()
-        self.logger.debug("run query", query=query.name)
+        # skip the lock if already connected, unless connection setup (which
+        # runs connect SQL after the connection is open) is in progress
+        if not self.connected or self._connect_lock.locked():
+            await self.connect()
+        if self._debug_enabled:
+            self.logger.debug("run query", query=query.name)
         self._pending_queries += 1
         try:
-            query_results = await self.execute_sql(
-                query.sql, parameters=query.parameters, timeout=query.timeout
+            return await self._with_timeout(
+                self._conn.execute_query(query), query.timeout
             )
-            return query.results(query_results)
         except TimeoutError:
             self.logger.warning("query timeout", query=query.name)
             raise QueryTimeoutExpired()
@@ -494,7 +810,6 @@ class DataBase:
                 query.name, error, fatal=isinstance(error, FATAL_ERRORS)
             )
         finally:
-            assert self._pending_queries >= 0, "pending queries is negative"
             self._pending_queries -= 1
             if not self.config.keep_connected and not self._pending_queries:
                 await self.close()
@@ -502,35 +817,27 @@ class DataBase:
     async def execute_sql(
         self,
         sql: str,
-        parameters: dict[str, t.Any] | None = None,
+        parameters: Mapping[str, t.Any] = _EMPTY_PARAMETERS,
         timeout: QueryTimeout | None = None,
     ) -> QueryResults:
         """Execute a raw SQL query."""
-        return await asyncio.wait_for(
-            self._conn.execute(text(sql), parameters),
-            timeout=timeout,
+        return await self._with_timeout(
+            self._conn.execute(_sql_text(sql), parameters), timeout
         )
 
+    async def _with_timeout(
+        self, call: Awaitable[_T], timeout: QueryTimeout | None
+    ) -> _T:
+        if timeout is None:
+            return await call
+        async with asyncio.timeout(timeout):
+            return await call
+
     async def _close(self) -> None:
         # ensure the connection with the DB is actually closed
         await self._conn.close()
         self.logger.debug("disconnected")
 
-    def _setup_query_latency_tracking(self, engine: Engine) -> None:
-        @event.listens_for(engine, "before_cursor_execute")  # type: ignore
-        def before_cursor_execute(
-            conn, cursor, statement, parameters, context, executemany
-        ) -> None:
-            conn.info["query_start_time"] = perf_counter()
-
-        @event.listens_for(engine, "after_cursor_execute")  # type: ignore
-        def after_cursor_execute(
-            conn, cursor, statement, parameters, context, executemany
-        ) -> None:
-            conn.info["query_latency"] = perf_counter() - conn.info.pop(
-                "query_start_time"
-            )
-
     def _query_db_error(
         self,
         query_name: str,
@@ -0,0 +1,19 @@
+"""Logging helpers."""
+
+import logging
+
+import structlog
+
+
+def is_debug_enabled(logger: structlog.stdlib.BoundLogger) -> bool:
+    """Return whether debug messages are emitted by a logger.
+
+    If the logger doesn't provide a way to tell, assume they are.
+
+    """
+    # structlog filtering loggers and stdlib-style loggers respectively
+    for attr in ("is_enabled_for", "isEnabledFor"):
+        is_enabled_for = getattr(logger, attr, None)
+        if is_enabled_for is not None:
+            return bool(is_enabled_for(logging.DEBUG))
+    return True
@@ -2,7 +2,7 @@
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Iterator, Mapping
+from collections.abc import Callable, Iterator, Mapping
 from datetime import datetime
 from decimal import Decimal
 import time
@@ -37,17 +37,26 @@ from .db import (
     Query,
     QueryTimeoutExpired,
 )
+from .log import is_debug_enabled
 
 
 class MetricsLastSeen:
     """Track last seen times for metrics.
 
-    It assumes labels are sorted by name in metrics.
+    It assumes labels are sorted by name in metrics, and that updates happen
+    with non-decreasing timestamps.
 
     """
 
+    __slots__ = ("_expirations", "_last_seen")
+
     def __init__(self, expirations: dict[str, int | None]):
-        self._expirations = expirations
+        # only track metrics that expire
+        self._expirations = {
+            name: expiration
+            for name, expiration in expirations.items()
+            if expiration
+        }
         self._last_seen: dict[str, dict[tuple[str, ...], float]] = defaultdict(
             dict
         )
@@ -55,16 +64,21 @@ class MetricsLastSeen:
     def update(
         self,
         name: str,
-        labels: dict[str, str],
+        label_values: tuple[str, ...],
         timestamp: float,
     ) -> None:
-        """Update last seen for a metric with a set of labels to given timestamp."""
-        if not self._expirations.get(name):
+        """Update last seen for a metric series to given timestamp.
+
+        Label values must be sorted by label name.
+
+        """
+        if name not in self._expirations:
             return
 
-        # sort by label name
-        label_values = tuple(value for _, value in sorted(labels.items()))
-        self._last_seen[name][label_values] = timestamp
+        metric_last_seen = self._last_seen[name]
+        # keep series ordered by last seen time, least recent first
+        metric_last_seen.pop(label_values, None)
+        metric_last_seen[label_values] = timestamp
 
     def expire_series(
         self, timestamp: float
@@ -79,12 +93,13 @@ class MetricsLastSeen:
         """
         expired = {}
         for name, metric_last_seen in self._last_seen.items():
-            expiration = t.cast(int, self._expirations[name])
-            expired_labels = [
-                label_values
-                for label_values, last_seen in metric_last_seen.items()
-                if timestamp > last_seen + expiration
-            ]
+            expiration = self._expirations[name]
+            expired_labels = []
+            for label_values, last_seen in metric_last_seen.items():
+                if timestamp <= last_seen + expiration:
+                    # following series have been seen more recently
+                    break
+                expired_labels.append(label_values)
             if expired_labels:
                 expired[name] = expired_labels
 
@@ -109,13 +124,19 @@ class QueryLoop:
         self._config = config
         self._registry = registry
         self._logger = logger or structlog.get_logger()
+        self._debug_enabled = is_debug_enabled(self._logger)
         self._timed_queries: list[Query] = []
         self._aperiodic_queries: list[Query] = []
         # map query names to their TimedCalls
         self._timed_calls: dict[str, TimedCall] = {}
         # map query names to list of database names
-        self._doomed_queries: dict[str, set[str]] = defaultdict(set)
-        self._loop = asyncio.get_event_loop()
+        self._doomed_queries: dict[str, set[str]] = {}
+        # tasks connecting databases in background
+        self._connect_tasks: set[asyncio.Task[None]] = set()
+        # map query and database names to futures for running aperiodic
+        # queries
+        self._running_queries: dict[tuple[str, str], asyncio.Future[None]] = {}
+        self._loop = asyncio.get_running_loop()
         self._last_seen = MetricsLastSeen(
             {
                 name: metric.config.get("expiration")
@@ -126,6 +147,28 @@ class QueryLoop:
             db_config.name: DataBase(db_config, logger=self._logger)
             for db_config in self._config.databases.values()
         }
+        # labels common to all metrics for each database
+        self._database_labels: dict[str, dict[str, str]] = {
+            db_config.name: {
+                DATABASE_LABEL: db_config.name,
+                **db_config.labels,
+            }
+            for db_config in self._config.databases.values()
+        }
+        # map metric names to the method used to update them
+        self._metric_methods: dict[str, str] = {
+            name: self._get_metric_method(metric)
+            for name, metric in self._config.metrics.items()
+        }
+        # map metric names to their label names, sorted
+        self._metric_labels: dict[str, tuple[str, ...]] = {
+            name: tuple(metric.labels)
+            for name, metric in self._config.metrics.items()
+        }
+        # functions updating metric series, by metric name and label values
+        self._metric_updaters: dict[
+            tuple[str, tuple[str, ...]], Callable[[t.Any], None]
+        ] = {}
 
         for query in self._config.queries.values():
             if query.timed:
@@ -144,9 +187,20 @@ class QueryLoop:
                 call = TimedCall(self._run_query, query)
                 call.start(self._loop_times_iter(query.schedule))
             self._timed_calls[query.name] = call
+        # open connections that are kept across queries in background, so the
+        # first queries don't pay for it, without delaying startup or queries
+        # on other databases
+        for db in self._databases.values():
+            if db.config.keep_connected:
+                task = self._loop.create_task(self._connect_database(db))
+                self._connect_tasks.add(task)
+                task.add_done_callback(self._connect_tasks.discard)
 
     async def stop(self) -> None:
         """Stop timed query execution."""
+        for task in self._connect_tasks:
+            task.cancel()
+        await asyncio.gather(*self._connect_tasks, return_exceptions=True)
         coros = (call.stop() for call in self._timed_calls.values())
         await asyncio.gather(*coros, return_exceptions=True)
         self._timed_calls.clear()
@@ -160,16 +214,26 @@ class QueryLoop:
             metric = self._registry.get_metric(name)
             for values in label_values:
                 metric.remove(*values)
+                self._metric_updaters.pop((name, values), None)
 
     async def run_aperiodic_queries(self) -> None:
         """Run queries on request."""
         coros = (
-            self._execute_query(query, dbname)
+            self._execute_aperiodic_query(query, dbname)
             for query in self._aperiodic_queries
             for dbname in query.databases
         )
         await asyncio.gather(*coros, return_exceptions=True)
 
+    async def _connect_database(self, db: DataBase) -> None:
+        """Connect a database in background."""
+        try:
+            await db.connect()
+        except DataBaseError:
+            # errors are logged by the database, and connection is retried
+            # when queries run
+            pass
+
     def _loop_times_iter(self, schedule: str) -> Iterator[float | int]:
         """Wrap a croniter iterator to sync time with the loop clock."""
         cron_iter = croniter(schedule, datetime.now(gettz()))
@@ -184,6 +248,29 @@ class QueryLoop:
         for dbname in query.databases:
             self._loop.create_task(self._execute_query(query, dbname))
 
+    async def _execute_aperiodic_query(
+        self, query: Query, dbname: str
+    ) -> None:
+        """Execute an aperiodic Query on a DataBase.
+
+        If the query is already running on the database (e.g. for concurrent
+        requests), wait for it to complete instead of running it again.
+
+        """
+        key = (query.name, dbname)
+        running = self._running_queries.get(key)
+        if running is not None:
+            await asyncio.shield(running)
+            return
+
+        running = self._loop.create_future()
+        self._running_queries[key] = running
+        try:
+            await self._execute_query(query, dbname)
+        finally:
+            del self._running_queries[key]
+            running.set_result(None)
+
     async def _execute_query(self, query: Query, dbname: str) -> None:
         """'Execute a Query on a DataBase."""
         if await self._remove_if_dooomed(query, dbname):
@@ -204,7 +291,7 @@ class QueryLoop:
                     query=query.name,
                     database=dbname,
                 )
-                self._doomed_queries[query.name].add(dbname)
+                self._doomed_queries.setdefault(query.name, set()).add(dbname)
         else:
             for result in metric_results.results:
                 self._update_metric(
@@ -226,10 +313,11 @@ class QueryLoop:
         Return whether the query has been removed for the database.
 
         """
-        if dbname not in self._doomed_queries[query.name]:
+        doomed_dbnames = self._doomed_queries.get(query.name)
+        if not doomed_dbnames or dbname not in doomed_dbnames:
             return False
 
-        if set(query.databases) == self._doomed_queries[query.name]:
+        if set(query.databases) == doomed_dbnames:
             # the query has failed on all databases
             if query.timed:
                 self._timed_queries.remove(query)
@@ -253,22 +341,31 @@ class QueryLoop:
             value = 0.0
         elif isinstance(value, Decimal):
             value = float(value)
-        metric_config = self._config.metrics[name]
-        all_labels = {DATABASE_LABEL: database.config.name}
-        all_labels.update(database.config.labels)
+        all_labels = self._database_labels[database.config.name]
         if labels:
-            all_labels.update(labels)
-        method = self._get_metric_method(metric_config)
-        self._logger.debug(
-            "updating metric",
-            metric=name,
-            method=method,
-            value=value,
-            labels=all_labels,
+            all_labels = {**all_labels, **labels}
+        method = self._metric_methods[name]
+        if self._debug_enabled:
+            self._logger.debug(
+                "updating metric",
+                metric=name,
+                method=method,
+                value=value,
+                labels=all_labels,
+            )
+        # values are converted to strings like the metric does for its series,
+        # since e.g. 1, 1.0 and True are equal as keys but are different series
+        label_values = tuple(
+            [str(all_labels[label]) for label in self._metric_labels[name]]
         )
-        metric = self._registry.get_metric(name, labels=all_labels)
-        self._update_metric_value(metric, method, value)
-        self._last_seen.update(name, all_labels, self._loop.time())
+        key = (name, label_values)
+        update = self._metric_updaters.get(key)
+        if update is None:
+            metric = self._registry.get_metric(name, labels=all_labels)
+            update = self._get_metric_updater(metric, method)
+            self._metric_updaters[key] = update
+        update(value)
+        self._last_seen.update(name, label_values, self._loop.time())
 
     def _get_metric_method(self, metric: MetricConfig) -> str:
         if metric.type == "counter" and not metric.config.get(
@@ -285,14 +382,15 @@ class QueryLoop:
             }[metric.type]
         return method
 
-    def _update_metric_value(
-        self, metric: MetricWrapperBase, method: str, value: t.Any
-    ) -> None:
+    def _get_metric_updater(
+        self, metric: MetricWrapperBase, method: str
+    ) -> Callable[[t.Any], None]:
         if metric._type == "counter" and method == "set":
             # counters can only be incremented, directly set the underlying value
-            t.cast(Counter, metric)._value.set(value)
+            update = t.cast(Counter, metric)._value.set
         else:
-            getattr(metric, method)(value)
+            update = getattr(metric, method)
+        return t.cast(Callable[[t.Any], None], update)
 
     def _increment_queries_count(
         self, database: DataBase, query: Query, status: str
@@ -1,5 +1,6 @@
 """Script entry point."""
 
+import asyncio
 from functools import partial
 from pathlib import Path
 
@@ -53,12 +54,22 @@ class QueryExporterScript(PrometheusExporterScript):
                 show_default=True,
                 show_envvar=True,
             ),
+            click.Option(
+                ["--uvloop"],
+                type=bool,
+                help="use uvloop as event loop (requires the uvloop extra)",
+                is_flag=True,
+                show_default=True,
+                show_envvar=True,
+            ),
         ]
 
     def configure(self, args: Arguments) -> None:
         self.config = self._load_config(args.config)
         if args.check_only:
             raise SystemExit(0)
+        if args.uvloop:
+            self._setup_uvloop()
         self.create_metrics(self.config.metrics.values())
 
     async def on_application_startup(self, application: Application) -> None:
@@ -79,6 +90,15 @@ class QueryExporterScript(PrometheusExporterScript):
         await query_loop.run_aperiodic_queries()
         query_loop.clear_expired_series()
 
+    def _setup_uvloop(self) -> None:
+        """Use uvloop for the event loop the exporter runs on."""
+        try:
+            import uvloop
+        except ImportError:
+            self.logger.error("uvloop not available")
+            raise SystemExit(1)
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     def _load_config(self, paths: list[Path]) -> Config:
         """Load the application configuration."""
         try:
@@ -537,13 +537,13 @@ class TestLoadConfig:
         query1 = result.queries["q1"]
         assert query1.name == "q1"
         assert query1.databases == ["db1"]
-        assert query1.metrics == [QueryMetric("m1", ["l1", "l2"])]
+        assert query1.metrics == [QueryMetric("m1", ("l1", "l2"))]
         assert query1.sql == "SELECT 1"
         assert query1.parameters == {}
         query2 = result.queries["q2"]
         assert query2.name == "q2"
         assert query2.databases == ["db2"]
-        assert query2.metrics == [QueryMetric("m2", [])]
+        assert query2.metrics == [QueryMetric("m2", ())]
         assert query2.sql == "SELECT 2"
         assert query2.parameters == {}
 
@@ -571,7 +571,7 @@ class TestLoadConfig:
         query1 = result.queries["q[params0]"]
         assert query1.name == "q[params0]"
         assert query1.databases == ["db"]
-        assert query1.metrics == [QueryMetric("m", ["l"])]
+        assert query1.metrics == [QueryMetric("m", ("l",))]
         assert query1.sql == "SELECT :param1 AS l, :param2 AS m"
         assert query1.parameters == {
             "param1": "label1",
@@ -580,7 +580,7 @@ class TestLoadConfig:
         query2 = result.queries["q[params1]"]
         assert query2.name == "q[params1]"
         assert query2.databases == ["db"]
-        assert query2.metrics == [QueryMetric("m", ["l"])]
+        assert query2.metrics == [QueryMetric("m", ("l",))]
         assert query2.sql == "SELECT :param1 AS l, :param2 AS m"
         assert query2.parameters == {
             "param1": "label2",
@@ -614,7 +614,7 @@ class TestLoadConfig:
         # check common props for each query
         for query_name, query in result.queries.items():
             assert query.databases == ["db"]
-            assert query.metrics == [QueryMetric("m", ["l"])]
+            assert query.metrics == [QueryMetric("m", ("l",))]
             assert (
                 query.sql
                 == "SELECT :marketplace__name AS l, :item__status AS m"
@@ -1,8 +1,8 @@
 import asyncio
 from collections.abc import Iterator
+import threading
 import time
 import typing as t
-from unittest.mock import ANY
 
 import pytest
 from pytest_mock import MockerFixture
@@ -15,9 +15,13 @@ from sqlalchemy.engine import (
     Connection,
     Engine,
 )
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy.sql.elements import TextClause
 
 from query_exporter.db import (
+    EMPTY_LABELS,
+    AsyncDataBaseConnection,
     DataBase,
     DataBaseConfig,
     DataBaseConnectError,
@@ -29,11 +33,11 @@ from query_exporter.db import (
     InvalidResultColumnNames,
     InvalidResultCount,
     MetricResult,
+    MetricResults,
     Query,
     QueryMetric,
     QueryResults,
     QueryTimeoutExpired,
-    WorkerAction,
     create_db_engine,
 )
 
@@ -63,8 +67,8 @@ class TestQuery:
             "query",
             ["db1", "db2"],
             [
-                QueryMetric("metric1", ["label1", "label2"]),
-                QueryMetric("metric2", ["label2"]),
+                QueryMetric("metric1", ("label1", "label2")),
+                QueryMetric("metric2", ("label2",)),
             ],
             "SELECT 1",
         )
@@ -72,8 +76,8 @@ class TestQuery:
         assert query.config_name == "query"
         assert query.databases == ["db1", "db2"]
         assert query.metrics == [
-            QueryMetric("metric1", ["label1", "label2"]),
-            QueryMetric("metric2", ["label2"]),
+            QueryMetric("metric1", ("label1", "label2")),
+            QueryMetric("metric2", ("label2",)),
         ]
         assert query.sql == "SELECT 1"
         assert query.parameters == {}
@@ -84,7 +88,7 @@ class TestQuery:
         query = Query(
             "query",
             ["db"],
-            [QueryMetric("metric", [])],
+            [QueryMetric("metric", ())],
             "SELECT metric1 FROM table",
             config_name="query_config",
         )
@@ -95,14 +99,16 @@ class TestQuery:
             "query",
             ["db1", "db2"],
             [
-                QueryMetric("metric1", ["label1", "label2"]),
-                QueryMetric("metric2", ["label2"]),
+                QueryMetric("metric1", ("label1", "label2")),
+                QueryMetric("metric2", ("label2",)),
             ],
             "SELECT metric1, metric2, label1, label2 FROM table"
             " WHERE x < :param1 AND  y > :param2",
             parameters={"param1": 1, "param2": 2},
         )
         assert query.parameters == {"param1": 1, "param2": 2}
+        with pytest.raises(TypeError):
+            query.parameters["param1"] = 10  # type: ignore
 
     def test_instantiate_parameters_not_matching(self) -> None:
         with pytest.raises(InvalidQueryParameters):
@@ -110,21 +116,30 @@ class TestQuery:
                 "query",
                 ["db1", "db2"],
                 [
-                    QueryMetric("metric1", ["label1", "label2"]),
-                    QueryMetric("metric2", ["label2"]),
+                    QueryMetric("metric1", ("label1", "label2")),
+                    QueryMetric("metric2", ("label2",)),
                 ],
                 "SELECT metric1, metric2, label1, label2 FROM table"
                 " WHERE x < :param1 AND  y > :param3",
                 parameters={"param1": 1, "param2": 2},
             )
 
+    def test_instantiate_missing_parameters(self) -> None:
+        with pytest.raises(InvalidQueryParameters):
+            Query(
+                "query",
+                ["db"],
+                [QueryMetric("metric", ())],
+                "SELECT metric FROM table WHERE x < :param",
+            )
+
     def test_instantiate_with_interval(self) -> None:
         query = Query(
             "query",
             ["db1", "db2"],
             [
-                QueryMetric("metric1", ["label1", "label2"]),
-                QueryMetric("metric2", ["label2"]),
+                QueryMetric("metric1", ("label1", "label2")),
+                QueryMetric("metric2", ("label2",)),
             ],
             "SELECT 1",
             interval=20,
@@ -136,8 +151,8 @@ class TestQuery:
             "query",
             ["db1", "db2"],
             [
-                QueryMetric("metric1", ["label1", "label2"]),
-                QueryMetric("metric2", ["label2"]),
+                QueryMetric("metric1", ("label1", "label2")),
+                QueryMetric("metric2", ("label2",)),
             ],
             "SELECT 1",
             schedule="0 * * * *",
@@ -149,7 +164,7 @@ class TestQuery:
             Query(
                 "query",
                 ["db1"],
-                [QueryMetric("metric1", [])],
+                [QueryMetric("metric1", ())],
                 "SELECT 1",
                 interval=20,
                 schedule="0 * * * *",
@@ -164,7 +179,7 @@ class TestQuery:
             Query(
                 "query",
                 ["db1"],
-                [QueryMetric("metric1", [])],
+                [QueryMetric("metric1", ())],
                 "SELECT 1",
                 schedule="wrong",
             )
@@ -177,7 +192,7 @@ class TestQuery:
         query = Query(
             "query",
             ["db"],
-            [QueryMetric("metric", [])],
+            [QueryMetric("metric", ())],
             "SELECT 1",
             timeout=2.0,
         )
@@ -196,8 +211,8 @@ class TestQuery:
             "query",
             ["db1", "db2"],
             [
-                QueryMetric("metric1", ["label1", "label2"]),
-                QueryMetric("metric2", ["label2"]),
+                QueryMetric("metric1", ("label1", "label2")),
+                QueryMetric("metric2", ("label2",)),
             ],
             "SELECT 1",
             **kwargs,
@@ -209,16 +224,57 @@ class TestQuery:
             "query",
             ["db1", "db2"],
             [
-                QueryMetric("metric1", ["label1", "label2"]),
-                QueryMetric("metric2", ["label2"]),
+                QueryMetric("metric1", ("label1", "label2")),
+                QueryMetric("metric2", ("label2",)),
             ],
             "SELECT 1",
         )
         assert query.labels() == frozenset(["label1", "label2"])
 
+    def test_labels_same_metrics(self) -> None:
+        metrics = [
+            QueryMetric("metric1", ("label1", "label2")),
+            QueryMetric("metric2", ("label2",)),
+        ]
+        query1 = Query("query1", ["db"], metrics, "SELECT 1")
+        query2 = Query("query2", ["db"], metrics, "SELECT 2")
+        assert query1.labels() == query2.labels() == {"label1", "label2"}
+        query_results = QueryResults(
+            ("metric1", "metric2", "label1", "label2"), [(1, 2, "foo", "bar")]
+        )
+        assert (
+            query1.results(query_results).results
+            == query2.results(query_results).results
+            == [
+                MetricResult("metric1", 1, {"label1": "foo", "label2": "bar"}),
+                MetricResult("metric2", 2, {"label2": "bar"}),
+            ]
+        )
+
+    def test_labels_as_list(self) -> None:
+        query = Query(
+            "query",
+            ["db"],
+            [QueryMetric("metric", ["label"])],  # type: ignore
+            "SELECT 1",
+        )
+        assert query.metrics == [QueryMetric("metric", ("label",))]
+        assert query.labels() == frozenset(["label"])
+
+    def test_text_clause(self) -> None:
+        query = Query(
+            "query",
+            ["db"],
+            [QueryMetric("metric", ())],
+            "SELECT :param AS metric",
+            parameters={"param": 1},
+        )
+        assert isinstance(query.text_clause, TextClause)
+        assert query.text_clause.text == "SELECT :param AS metric"
+
     def test_results_empty(self) -> None:
-        query = Query("query", ["db"], [QueryMetric("metric", [])], "")
-        query_results = QueryResults(["one"], [])
+        query = Query("query", ["db"], [QueryMetric("metric", ())], "")
+        query_results = QueryResults(("one",), [])
         metrics_results = query.results(query_results)
         assert metrics_results.results == []
 
@@ -226,7 +282,7 @@ class TestQuery:
         query = Query(
             "query",
             ["db"],
-            [QueryMetric("metric1", []), QueryMetric("metric2", [])],
+            [QueryMetric("metric1", ()), QueryMetric("metric2", ())],
             "",
         )
         query_results = QueryResults(
@@ -239,14 +295,18 @@ class TestQuery:
             MetricResult("metric1", 44, {}),
             MetricResult("metric2", 33, {}),
         ]
+        assert all(
+            type(result) is MetricResult and result.labels is EMPTY_LABELS
+            for result in metrics_results.results
+        )
 
     def test_results_metrics_with_labels(self) -> None:
         query = Query(
             "query",
             ["db"],
             [
-                QueryMetric("metric1", ["label1", "label2"]),
-                QueryMetric("metric2", ["label2"]),
+                QueryMetric("metric1", ("label1", "label2")),
+                QueryMetric("metric2", ("label2",)),
             ],
             "",
         )
@@ -262,25 +322,50 @@ class TestQuery:
             MetricResult("metric2", 33, {"label2": "baz"}),
         ]
 
+    def test_results_plan_cached(self) -> None:
+        query = Query(
+            "query",
+            ["db"],
+            [QueryMetric("metric", ("label",))],
+            "",
+        )
+        query.results(QueryResults(("metric", "label"), [(1, "foo")]))
+        plan = query._results_plan
+        metrics_results = query.results(
+            QueryResults(("metric", "label"), [(2, "bar")])
+        )
+        assert query._results_plan is plan
+        assert metrics_results.results == [
+            MetricResult("metric", 2, {"label": "bar"})
+        ]
+        # a different columns order produces a new plan
+        metrics_results = query.results(
+            QueryResults(("label", "metric"), [("baz", 3)])
+        )
+        assert query._results_plan is not plan
+        assert metrics_results.results == [
+            MetricResult("metric", 3, {"label": "baz"})
+        ]
+
     def test_results_wrong_result_count(self) -> None:
-        query = Query("query", ["db"], [QueryMetric("metric1", [])], "")
-        query_results = QueryResults(["one", "two"], [(1, 2)])
+        query = Query("query", ["db"], [QueryMetric("metric1", ())], "")
+        query_results = QueryResults(("one", "two"), [(1, 2)])
         with pytest.raises(InvalidResultCount):
             query.results(query_results)
 
     def test_results_wrong_result_count_with_label(self) -> None:
         query = Query(
-            "query", ["db"], [QueryMetric("metric1", ["label1"])], ""
+            "query", ["db"], [QueryMetric("metric1", ("label1",))], ""
         )
-        query_results = QueryResults(["one"], [(1,)])
+        query_results = QueryResults(("one",), [(1,)])
         with pytest.raises(InvalidResultCount):
             query.results(query_results)
 
     def test_results_wrong_names_with_labels(self) -> None:
         query = Query(
-            "query", ["db"], [QueryMetric("metric1", ["label1"])], ""
+            "query", ["db"], [QueryMetric("metric1", ("label1",))], ""
         )
-        query_results = QueryResults(["one", "two"], [(1, 2)])
+        query_results = QueryResults(("one", "two"), [(1, 2)])
         with pytest.raises(InvalidResultColumnNames) as error:
             query.results(query_results)
         assert str(error.value) == (
@@ -288,6 +373,43 @@ class TestQuery:
             "expected (label1, metric1), got (one, two)"
         )
 
+    def test_stream_results(self) -> None:
+        query = Query("query", ["db"], [QueryMetric("metric", ("label",))], "")
+        engine = create_engine("sqlite://")
+        with engine.connect() as conn:
+            result = conn.execute(
+                text(
+                    "SELECT 1 AS metric, 'foo' AS label"
+                    " UNION ALL SELECT 2, 'bar'"
+                )
+            )
+            metrics_results = query.stream_results(
+                result, timestamp=123.4, latency=1.2
+            )
+        assert metrics_results.results == [
+            MetricResult("metric", 1, {"label": "foo"}),
+            MetricResult("metric", 2, {"label": "bar"}),
+        ]
+        assert metrics_results.timestamp == 123.4
+        assert metrics_results.latency == 1.2
+
+    def test_stream_results_empty(self) -> None:
+        query = Query("query", ["db"], [QueryMetric("metric", ())], "")
+        engine = create_engine("sqlite://")
+        with engine.connect() as conn:
+            result = conn.execute(text("SELECT 1 AS other WHERE 1 = 0"))
+            metrics_results = query.stream_results(result)
+        assert metrics_results.results == []
+
+    def test_stream_results_no_rows(self) -> None:
+        query = Query("query", ["db"], [QueryMetric("metric", ())], "")
+        engine = create_engine("sqlite://")
+        with engine.connect() as conn:
+            result = conn.execute(text("PRAGMA auto_vacuum = 1"))
+            metrics_results = query.stream_results(result)
+        assert metrics_results.results == []
+        assert result.closed
+
 
 class TestQueryResults:
     def test_from_result(self) -> None:
@@ -295,8 +417,9 @@ class TestQueryResults:
         with engine.connect() as conn:
             result = conn.execute(text("SELECT 1 AS a, 2 AS b"))
             query_results = QueryResults.from_result(result)
-        assert query_results.keys == ["a", "b"]
+        assert query_results.keys == ("a", "b")
         assert query_results.rows == [(1, 2)]
+        assert type(query_results.rows[0]) is tuple
         assert query_results.latency is None
         assert query_results.timestamp < time.time()
 
@@ -305,21 +428,21 @@ class TestQueryResults:
         with engine.connect() as conn:
             result = conn.execute(text("PRAGMA auto_vacuum = 1"))
             query_results = QueryResults.from_result(result)
-        assert query_results.keys == []
-        assert query_results.rows == []
+        assert query_results.keys == ()
+        assert query_results.rows == ()
         assert query_results.latency is None
 
     def test_from_result_with_latency(self) -> None:
         engine = create_engine("sqlite://")
         with engine.connect() as conn:
             result = conn.execute(text("SELECT 1 AS a, 2 AS b"))
-            # simulate latency tracking
-            conn.info["query_latency"] = 1.2
-            query_results = QueryResults.from_result(result)
-        assert query_results.keys == ["a", "b"]
+            query_results = QueryResults.from_result(
+                result, timestamp=123.4, latency=1.2
+            )
+        assert query_results.keys == ("a", "b")
         assert query_results.rows == [(1, 2)]
         assert query_results.latency == 1.2
-        assert query_results.timestamp < time.time()
+        assert query_results.timestamp == 123.4
 
 
 @pytest.fixture
@@ -330,26 +453,6 @@ async def conn() -> Iterator[DataBaseConnection]:
     await connection.close()
 
 
-class TestWorkerAction:
-    async def test_call_wait(self) -> None:
-        def func(a: int, b: int) -> int:
-            return a + b
-
-        action = WorkerAction(func, 10, 20)
-        action()
-        assert await action.result() == 30
-
-    async def test_call_exception(self) -> None:
-        def func() -> None:
-            raise Exception("fail!")
-
-        action = WorkerAction(func)
-        action()
-        with pytest.raises(Exception) as error:
-            await action.result()
-        assert str(error.value) == "fail!"
-
-
 class TestDataBaseConnection:
     def test_engine(self, conn: DataBaseConnection) -> None:
         assert isinstance(conn.engine, Engine)
@@ -358,7 +461,7 @@ class TestDataBaseConnection:
         await conn.open()
         assert conn.connected
         assert conn._conn is not None
-        assert conn._worker.is_alive()
+        assert conn._executor is not None
 
     async def test_open_noop(self, conn: DataBaseConnection) -> None:
         await conn.open()
@@ -370,6 +473,7 @@ class TestDataBaseConnection:
         await conn.close()
         assert not conn.connected
         assert conn._conn is None
+        assert conn._executor is None
 
     async def test_close_noop(self, conn: DataBaseConnection) -> None:
         await conn.open()
@@ -380,7 +484,7 @@ class TestDataBaseConnection:
     async def test_execute(self, conn: DataBaseConnection) -> None:
         await conn.open()
         query_results = await conn.execute(text("SELECT 1 AS a, 2 AS b"))
-        assert query_results.keys == ["a", "b"]
+        assert query_results.keys == ("a", "b")
         assert query_results.rows == [(1, 2)]
 
     async def test_execute_with_params(self, conn: DataBaseConnection) -> None:
@@ -388,9 +492,218 @@ class TestDataBaseConnection:
         query_results = await conn.execute(
             text("SELECT :a AS a, :b AS b"), parameters={"a": 1, "b": 2}
         )
-        assert query_results.keys == ["a", "b"]
+        assert query_results.keys == ("a", "b")
         assert query_results.rows == [(1, 2)]
 
+    async def test_execute_concurrent(self, conn: DataBaseConnection) -> None:
+        await conn.open()
+        results = await asyncio.gather(
+            *(conn.execute(text(f"SELECT {i} AS a")) for i in range(5))
+        )
+        assert [query_results.rows for query_results in results] == [
+            [(i,)] for i in range(5)
+        ]
+
+    async def test_execute_query(self, conn: DataBaseConnection) -> None:
+        query = Query(
+            "query", ["db"], [QueryMetric("metric", ())], "SELECT 1 AS metric"
+        )
+        await conn.open()
+        metric_results = await conn.execute_query(query)
+        assert metric_results.results == [MetricResult("metric", 1, {})]
+        assert isinstance(metric_results.latency, float)
+
+    async def test_execute_query_multiple_rows(
+        self, conn: DataBaseConnection
+    ) -> None:
+        query = Query(
+            "query",
+            ["db"],
+            [QueryMetric("metric", ())],
+            "SELECT 1 AS metric UNION ALL SELECT 2 UNION ALL SELECT 3",
+        )
+        await conn.open()
+        metric_results = await conn.execute_query(query)
+        assert metric_results.results == [
+            MetricResult("metric", value, {}) for value in (1, 2, 3)
+        ]
+
+    async def test_execute_query_autocommit_no_stream_results(
+        self, mocker: MockerFixture
+    ) -> None:
+        engine = create_engine(
+            "sqlite://", execution_options={"isolation_level": "AUTOCOMMIT"}
+        )
+        conn = DataBaseConnection("db", engine)
+        query = Query(
+            "query", ["db"], [QueryMetric("metric", ())], "SELECT 1 AS metric"
+        )
+        stream_results = mocker.spy(Query, "stream_results")
+        await conn.open()
+        try:
+            await conn.execute_query(query)
+        finally:
+            await conn.close()
+        _, result = stream_results.call_args.args
+        execution_options = result.context.execution_options
+        assert execution_options["isolation_level"] == "AUTOCOMMIT"
+        # server-side cursors are not requested
+        assert "stream_results" not in execution_options
+        assert "yield_per" not in execution_options
+
+    async def test_call_in_thread(self, conn: DataBaseConnection) -> None:
+        def func(a: int, b: int = 0) -> int:
+            return a - b
+
+        await conn.open()
+        assert await conn._call_in_thread(func, 10) == 10
+        assert await conn._call_in_thread(func, 10, b=3) == 7
+
+    async def test_execute_many(self, conn: DataBaseConnection) -> None:
+        await conn.open()
+        await conn.execute_many(
+            ["CREATE TABLE test (x INTEGER)", "INSERT INTO test VALUES (1)"]
+        )
+        query_results = await conn.execute(text("SELECT x FROM test"))
+        assert query_results.rows == [(1,)]
+
+    async def test_execute_many_error(self, conn: DataBaseConnection) -> None:
+        await conn.open()
+        with pytest.raises(DataBaseQueryError) as error:
+            await conn.execute_many(["SELECT 1", "WRONG"])
+        assert str(error.value).startswith('failed executing query "WRONG"')
+
+
+@pytest.fixture
+async def async_conn() -> Iterator[AsyncDataBaseConnection]:
+    engine = create_engine("sqlite+aiosqlite://")
+    connection = AsyncDataBaseConnection("db", engine)
+    yield connection
+    await connection.close()
+
+
+class TestAsyncDataBaseConnection:
+    async def test_open(self, async_conn: AsyncDataBaseConnection) -> None:
+        await async_conn.open()
+        assert async_conn.connected
+        assert async_conn._conn is not None
+
+    async def test_open_noop(
+        self, async_conn: AsyncDataBaseConnection
+    ) -> None:
+        await async_conn.open()
+        conn = async_conn._conn
+        await async_conn.open()
+        assert async_conn._conn is conn
+
+    async def test_close(self, async_conn: AsyncDataBaseConnection) -> None:
+        await async_conn.open()
+        await async_conn.close()
+        assert not async_conn.connected
+        assert async_conn._conn is None
+
+    async def test_close_noop(
+        self, async_conn: AsyncDataBaseConnection
+    ) -> None:
+        await async_conn.open()
+        await async_conn.close()
+        await async_conn.close()
+        assert not async_conn.connected
+
+    async def test_execute(self, async_conn: AsyncDataBaseConnection) -> None:
+        await async_conn.open()
+        query_results = await async_conn.execute(text("SELECT 1 AS a, 2 AS b"))
+        assert query_results.keys == ("a", "b")
+        assert query_results.rows == [(1, 2)]
+
+    async def test_execute_with_params(
+        self, async_conn: AsyncDataBaseConnection
+    ) -> None:
+        await async_conn.open()
+        query_results = await async_conn.execute(
+            text("SELECT :a AS a, :b AS b"), parameters={"a": 1, "b": 2}
+        )
+        assert query_results.keys == ("a", "b")
+        assert query_results.rows == [(1, 2)]
+
+    async def test_execute_query(
+        self, async_conn: AsyncDataBaseConnection
+    ) -> None:
+        query = Query(
+            "query", ["db"], [QueryMetric("metric", ())], "SELECT 1 AS metric"
+        )
+        await async_conn.open()
+        metric_results = await async_conn.execute_query(query)
+        assert metric_results.results == [MetricResult("metric", 1, {})]
+        assert isinstance(metric_results.latency, float)
+
+    async def test_execute_many(
+        self, async_conn: AsyncDataBaseConnection
+    ) -> None:
+        await async_conn.open()
+        await async_conn.execute_many(
+            ["CREATE TABLE test (x INTEGER)", "INSERT INTO test VALUES (1)"]
+        )
+        query_results = await async_conn.execute(text("SELECT x FROM test"))
+        assert query_results.rows == [(1,)]
+
+    async def test_execute_many_error(
+        self, async_conn: AsyncDataBaseConnection
+    ) -> None:
+        await async_conn.open()
+        with pytest.raises(DataBaseQueryError) as error:
+            await async_conn.execute_many(["SELECT 1", "WRONG"])
+        assert str(error.value).startswith('failed executing query "WRONG"')
+        assert not async_conn.connected
+
+    async def test_execute_many_cancelled(
+        self, mocker: MockerFixture, async_conn: AsyncDataBaseConnection
+    ) -> None:
+        await async_conn.open()
+        mocker.patch.object(
+            AsyncConnection, "execute", side_effect=asyncio.CancelledError
+        )
+        with pytest.raises(asyncio.CancelledError):
+            await async_conn.execute_many(["SELECT 1"])
+        assert not async_conn.connected
+
+    async def test_execute_error(
+        self, async_conn: AsyncDataBaseConnection
+    ) -> None:
+        await async_conn.open()
+        with pytest.raises(OperationalError):
+            await async_conn.execute(text("SELECT WRONG"))
+        # the connection is discarded, and a new one can be opened
+        assert not async_conn.connected
+        await async_conn.open()
+        query_results = await async_conn.execute(text("SELECT 1 AS a"))
+        assert query_results.rows == [(1,)]
+
+    async def test_execute_query_error(
+        self, async_conn: AsyncDataBaseConnection
+    ) -> None:
+        query = Query(
+            "query", ["db"], [QueryMetric("metric", ())], "SELECT WRONG"
+        )
+        await async_conn.open()
+        with pytest.raises(OperationalError):
+            await async_conn.execute_query(query)
+        assert not async_conn.connected
+
+    async def test_close_after_error(
+        self, async_conn: AsyncDataBaseConnection
+    ) -> None:
+        await async_conn.open()
+        with pytest.raises(OperationalError):
+            await async_conn.execute(text("SELECT WRONG"))
+        await async_conn.close()
+        # driver worker threads are stopped
+        assert not [
+            thread
+            for thread in threading.enumerate()
+            if "_connection_worker_thread" in thread.name
+        ]
+
 
 @pytest.fixture
 def db_config() -> Iterator[DataBaseConfig]:
@@ -420,21 +733,49 @@ class TestDataBase:
         assert db.connected
         assert isinstance(db._conn._conn, Connection)
 
+    async def test_engine_per_database(self) -> None:
+        # engines (and their connection pools) are not shared, since each
+        # database holds its connection for as long as it's connected
+        db1 = DataBase(DataBaseConfig(name="db1", dsn="sqlite://"))
+        db2 = DataBase(DataBaseConfig(name="db2", dsn="sqlite://"))
+        assert db1._conn.engine is not db2._conn.engine
+
+    async def test_connect_async_driver(self) -> None:
+        config = DataBaseConfig(name="db", dsn="sqlite+aiosqlite://")
+        db = DataBase(config)
+        assert isinstance(db._conn, AsyncDataBaseConnection)
+        await db.connect()
+        assert db.connected
+        await db.close()
+
+    async def test_execute_async_driver(self) -> None:
+        config = DataBaseConfig(name="db", dsn="sqlite+aiosqlite://")
+        db = DataBase(config)
+        query = Query(
+            "query",
+            ["db"],
+            [QueryMetric("metric", ("label",))],
+            "SELECT 1 AS metric, 'foo' AS label",
+        )
+        async with db:
+            metric_results = await db.execute(query)
+        assert metric_results.results == [
+            MetricResult("metric", 1, {"label": "foo"})
+        ]
+        assert isinstance(metric_results.latency, float)
+
     async def test_connect_log(
         self, log: StructuredLogCapture, db: DataBase
     ) -> None:
         await db.connect()
-        assert log.has("start", database="db", worker_id=ANY, level="debug")
+        assert log.has("start", database="db", level="debug")
         assert log.has(
             "action received",
             action="_connect",
             database="db",
-            worker_id=ANY,
             level="debug",
         )
-        assert log.has(
-            "connected", database="db", worker_id=ANY, level="debug"
-        )
+        assert log.has("connected", database="db", level="debug")
 
     async def test_connect_lock(self, db: DataBase) -> None:
         await asyncio.gather(db.connect(), db.connect())
@@ -456,10 +797,10 @@ class TestDataBase:
 
         queries = []
 
-        async def execute_sql(sql):
-            queries.append(sql)
+        async def execute_many(sqls: list[str]) -> None:
+            queries.extend(sqls)
 
-        db.execute_sql = execute_sql
+        db._conn.execute_many = execute_many
         await db.connect()
         assert queries == ["SELECT 1", "SELECT 2"]
         await db.close()
@@ -482,8 +823,8 @@ class TestDataBase:
     ) -> None:
         await db.connect()
         await db.close()
-        assert log.has("action received", worker_id=ANY, action="_close")
-        assert log.has("shutdown", worker_id=ANY)
+        assert log.has("action received", action="_close")
+        assert log.has("shutdown", database="db")
         assert log.has("disconnected", database="db")
         assert not db.connected
         assert db._conn._conn is None
@@ -494,14 +835,28 @@ class TestDataBase:
         query = Query(
             "query",
             ["db"],
-            [QueryMetric("metric", [])],
+            [QueryMetric("metric", ())],
             "SELECT 1.0 AS metric",
         )
         await db.connect()
         await db.execute(query)
         assert log.has("run query", query="query", database="db")
-        assert log.has("action received", worker_id=ANY, action="_execute")
-        assert log.has("action received", worker_id=ANY, action="from_result")
+        assert log.has("action received", action="_execute_query")
+        await db.close()
+
+    async def test_execute_log_debug_disabled(
+        self, log: StructuredLogCapture, db: DataBase
+    ) -> None:
+        query = Query(
+            "query",
+            ["db"],
+            [QueryMetric("metric", ())],
+            "SELECT 1.0 AS metric",
+        )
+        db._debug_enabled = False
+        await db.connect()
+        await db.execute(query)
+        assert not log.has("run query", query="query", database="db")
         await db.close()
 
     @pytest.mark.parametrize("connected", [True, False])
@@ -515,7 +870,7 @@ class TestDataBase:
         query = Query(
             "query",
             ["db"],
-            [QueryMetric("metric", [])],
+            [QueryMetric("metric", ())],
             "SELECT 1.0 AS metric",
         )
         await db.connect()
@@ -536,22 +891,48 @@ class TestDataBase:
         query1 = Query(
             "query1",
             ["db"],
-            [QueryMetric("metric1", [])],
+            [QueryMetric("metric1", ())],
             "SELECT 1.0 AS metric1",
         )
         query2 = Query(
             "query1",
             ["db"],
-            [QueryMetric("metric2", [])],
+            [QueryMetric("metric2", ())],
             "SELECT 1.0 AS metric2",
         )
         await db.connect()
         await asyncio.gather(db.execute(query1), db.execute(query2))
         assert not db.connected
 
+    async def test_execute_connected_skip_connect(
+        self, mocker: MockerFixture, db: DataBase
+    ) -> None:
+        query = Query(
+            "query", ["db"], [QueryMetric("metric", ())], "SELECT 1 AS metric"
+        )
+        await db.connect()
+        mock_connect = mocker.spy(db, "connect")
+        await db.execute(query)
+        mock_connect.assert_not_called()
+
+    async def test_execute_wait_connecting(
+        self, mocker: MockerFixture, db: DataBase
+    ) -> None:
+        query = Query(
+            "query", ["db"], [QueryMetric("metric", ())], "SELECT 1 AS metric"
+        )
+        await db.connect()
+        mock_connect = mocker.spy(db, "connect")
+        async with db._connect_lock:
+            task = asyncio.create_task(db.execute(query))
+            await asyncio.sleep(0)
+            assert not task.done()
+        await task
+        mock_connect.assert_called_once()
+
     async def test_execute_not_connected(self, db: DataBase) -> None:
         query = Query(
-            "query", ["db"], [QueryMetric("metric", [])], "SELECT 1 AS metric"
+            "query", ["db"], [QueryMetric("metric", ())], "SELECT 1 AS metric"
         )
         metric_results = await db.execute(query)
         assert metric_results.results == [MetricResult("metric", 1, {})]
@@ -566,7 +947,7 @@ class TestDataBase:
         query = Query(
             "query",
             ["db"],
-            [QueryMetric("metric1", []), QueryMetric("metric2", [])],
+            [QueryMetric("metric1", ()), QueryMetric("metric2", ())],
             sql,
         )
         await db.connect()
@@ -593,8 +974,8 @@ class TestDataBase:
             "query",
             ["db"],
             [
-                QueryMetric("metric1", ["label1", "label2"]),
-                QueryMetric("metric2", ["label2"]),
+                QueryMetric("metric1", ("label1", "label2")),
+                QueryMetric("metric2", ("label2",)),
             ],
             sql,
         )
@@ -608,7 +989,7 @@ class TestDataBase:
         ]
 
     async def test_execute_fail(self, db: DataBase) -> None:
-        query = Query("query", 10, [QueryMetric("metric", [])], "WRONG")
+        query = Query("query", 10, [QueryMetric("metric", ())], "WRONG")
         await db.connect()
         with pytest.raises(DataBaseQueryError) as error:
             await db.execute(query)
@@ -620,7 +1001,7 @@ class TestDataBase:
         query = Query(
             "query",
             20,
-            [QueryMetric("metric", [])],
+            [QueryMetric("metric", ())],
             "SELECT 1 AS metric, 2 AS other",
         )
         await db.connect()
@@ -645,7 +1026,7 @@ class TestDataBase:
         query = Query(
             "query",
             ["db"],
-            [QueryMetric("metric", ["label"])],
+            [QueryMetric("metric", ("label",))],
             "SELECT 1 as metric",
         )
         await db.connect()
@@ -663,7 +1044,7 @@ class TestDataBase:
         query = Query(
             "query",
             ["db"],
-            [QueryMetric("metric", ["label"])],
+            [QueryMetric("metric", ("label",))],
             'SELECT 1 AS foo, "bar" AS label',
         )
         await db.connect()
@@ -681,12 +1062,12 @@ class TestDataBase:
         query = Query(
             "query",
             ["db"],
-            [QueryMetric("metric", [])],
+            [QueryMetric("metric", ())],
             "SELECT 1 AS metric",
         )
         await db.connect()
         exception = Exception("boom!")
-        mocker.patch.object(db, "execute_sql").side_effect = exception
+        mocker.patch.object(db._conn, "execute_query").side_effect = exception
 
         with pytest.raises(DataBaseQueryError) as error:
             await db.execute(query)
@@ -706,19 +1087,16 @@ class TestDataBase:
         query = Query(
             "query",
             ["db"],
-            [QueryMetric("metric", [])],
+            [QueryMetric("metric", ())],
             "SELECT 1 AS metric",
             timeout=0.1,
         )
         await db.connect()
 
-        async def execute(
-            sql: TextClause,
-            parameters: dict[str, t.Any] | None = None,
-        ) -> QueryResults:
+        async def execute_query(query: Query) -> MetricResults:
             await asyncio.sleep(1)  # longer than timeout
 
-        db._conn.execute = execute
+        db._conn.execute_query = execute_query
 
         with pytest.raises(QueryTimeoutExpired):
             await db.execute(query)
@@ -729,6 +1107,28 @@ class TestDataBase:
             level="warning",
         )
 
+    async def test_execute_timeout_async_driver(self) -> None:
+        config = DataBaseConfig(name="db", dsn="sqlite+aiosqlite://")
+        db = DataBase(config)
+        slow_query = Query(
+            "slow",
+            ["db"],
+            [QueryMetric("metric", ())],
+            "WITH RECURSIVE c(x) AS "
+            "(SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 2000000) "
+            "SELECT count(*) AS metric FROM c",
+            timeout=0.05,
+        )
+        query = Query(
+            "query", ["db"], [QueryMetric("metric", ())], "SELECT 1 AS metric"
+        )
+        async with db:
+            with pytest.raises(QueryTimeoutExpired):
+                await db.execute(slow_query)
+            # following queries run on a new connection
+            metric_results = await db.execute(query)
+        assert metric_results.results == [MetricResult("metric", 1, {})]
+
     async def test_execute_sql(self, db: DataBase) -> None:
         await db.connect()
         result = await db.execute_sql("SELECT 10, 20")
@@ -0,0 +1,32 @@
+import logging
+
+import structlog
+
+from query_exporter.log import is_debug_enabled
+
+
+class FilteringLogger:
+    def __init__(self, level: int) -> None:
+        self.level = level
+
+    def is_enabled_for(self, level: int) -> bool:
+        return level >= self.level
+
+
+class TestIsDebugEnabled:
+    def test_filtering_logger(self) -> None:
+        assert is_debug_enabled(FilteringLogger(logging.DEBUG))
+        assert not is_debug_enabled(FilteringLogger(logging.INFO))
+
+    def test_stdlib_logger(self) -> None:
+        logger = logging.getLogger("test")
+        logger.setLevel(logging.DEBUG)
+        assert is_debug_enabled(logger)
+        logger.setLevel(logging.INFO)
+        assert not is_debug_enabled(logger)
+
+    def test_unknown(self) -> None:
+        assert is_debug_enabled(object())
+
+    def test_structlog_logger(self) -> None:
+        assert is_debug_enabled(structlog.get_logger())
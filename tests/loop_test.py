@@ -14,7 +14,7 @@ import yaml
 
 from query_exporter import loop
 from query_exporter.config import load_config
-from query_exporter.db import DataBase, DataBaseConfig
+from query_exporter.db import DataBase, DataBaseConfig, DataBaseConnectError
 
 from .conftest import QueryTracker
 
@@ -106,9 +106,9 @@ async def run_queries(db_file: Path, *queries: str) -> None:
 class TestMetricsLastSeen:
     def test_update(self) -> None:
         last_seen = loop.MetricsLastSeen({"m1": 50, "m2": 100})
-        last_seen.update("m1", {"l1": "v1", "l2": "v2"}, 100)
-        last_seen.update("m1", {"l1": "v3", "l2": "v4"}, 200)
-        last_seen.update("other", {"l3": "v100"}, 300)
+        last_seen.update("m1", ("v1", "v2"), 100)
+        last_seen.update("m1", ("v3", "v4"), 200)
+        last_seen.update("other", ("v100",), 300)
         assert last_seen._last_seen == {
             "m1": {
                 ("v1", "v2"): 100,
@@ -116,15 +116,15 @@ class TestMetricsLastSeen:
             }
         }
 
-    def test_update_label_values_sorted_by_name(self) -> None:
-        last_seen = loop.MetricsLastSeen({"m1": 50})
-        last_seen.update("m1", {"l2": "v2", "l1": "v1"}, 100)
-        assert last_seen._last_seen == {"m1": {("v1", "v2"): 100}}
+    def test_update_no_expiration(self) -> None:
+        last_seen = loop.MetricsLastSeen({"m1": 50, "m2": None})
+        last_seen.update("m2", ("v1",), 100)
+        assert last_seen._last_seen == {}
 
     def test_expire_series_not_expired(self) -> None:
         last_seen = loop.MetricsLastSeen({"m1": 50})
-        last_seen.update("m1", {"l1": "v1", "l2": "v2"}, 10)
-        last_seen.update("m1", {"l1": "v3", "l2": "v4"}, 20)
+        last_seen.update("m1", ("v1", "v2"), 10)
+        last_seen.update("m1", ("v3", "v4"), 20)
         assert last_seen.expire_series(30) == {}
         assert last_seen._last_seen == {
             "m1": {
@@ -135,18 +135,26 @@ class TestMetricsLastSeen:
 
     def test_expire_series(self) -> None:
         last_seen = loop.MetricsLastSeen({"m1": 50, "m2": 100})
-        last_seen.update("m1", {"l1": "v1", "l2": "v2"}, 10)
-        last_seen.update("m1", {"l1": "v3", "l2": "v4"}, 100)
-        last_seen.update("m2", {"l3": "v100"}, 100)
+        last_seen.update("m1", ("v1", "v2"), 10)
+        last_seen.update("m1", ("v3", "v4"), 100)
+        last_seen.update("m2", ("v100",), 100)
         assert last_seen.expire_series(120) == {"m1": [("v1", "v2")]}
         assert last_seen._last_seen == {
             "m1": {("v3", "v4"): 100},
             "m2": {("v100",): 100},
         }
 
+    def test_expire_series_updated(self) -> None:
+        last_seen = loop.MetricsLastSeen({"m1": 50})
+        last_seen.update("m1", ("v1",), 10)
+        last_seen.update("m1", ("v2",), 20)
+        last_seen.update("m1", ("v1",), 80)
+        assert last_seen.expire_series(100) == {"m1": [("v2",)]}
+        assert last_seen._last_seen == {"m1": {("v1",): 80}}
+
     def test_expire_no_labels(self) -> None:
         last_seen = loop.MetricsLastSeen({"m1": 50})
-        last_seen.update("m1", {}, 10)
+        last_seen.update("m1", (), 10)
         expired = last_seen.expire_series(120)
         assert expired == {"m1": [()]}
         assert last_seen._last_seen == {}
@@ -161,6 +169,60 @@ class TestQueryLoop:
         assert timed_call.running
         await query_tracker.wait_results()
 
+    async def test_start_connects_databases(
+        self, config_data: dict[str, t.Any], make_query_loop: MakeQueryLoop
+    ) -> None:
+        config_data["databases"]["db2"] = {
+            "dsn": "sqlite://",
+            "keep-connected": False,
+        }
+        del config_data["queries"]["q"]["interval"]
+        query_loop = make_query_loop()
+        await query_loop.start()
+        await asyncio.gather(*query_loop._connect_tasks)
+        assert query_loop._connect_tasks == set()
+        assert query_loop._databases["db"].connected
+        assert not query_loop._databases["db2"].connected
+
+    async def test_start_connect_error(
+        self, mocker: MockerFixture, query_loop: loop.QueryLoop
+    ) -> None:
+        db = query_loop._databases["db"]
+        mocker.patch.object(
+            db, "connect", side_effect=DataBaseConnectError("failed")
+        )
+        await query_loop.start()
+        # queries are still started
+        assert query_loop._timed_calls["q"].running
+        # errors are not raised from background tasks
+        await asyncio.gather(*query_loop._connect_tasks)
+
+    async def test_start_connect_hanging(
+        self,
+        mocker: MockerFixture,
+        query_tracker: QueryTracker,
+        config_data: dict[str, t.Any],
+        make_query_loop: MakeQueryLoop,
+    ) -> None:
+        config_data["databases"]["db2"] = {"dsn": "sqlite://"}
+        config_data["queries"]["q"]["databases"] = ["db2"]
+        query_loop = make_query_loop()
+
+        async def connect() -> None:
+            await asyncio.Event().wait()
+
+        mocker.patch.object(query_loop._databases["db"], "connect", connect)
+        await query_loop.start()
+        # queries on other databases run while connection is pending
+        await query_tracker.wait_results()
+        [task] = [
+            task for task in query_loop._connect_tasks if not task.done()
+        ]
+        await query_loop.stop()
+        # pending connections are cancelled on stop
+        assert task.cancelled()
+        assert query_loop._connect_tasks == set()
+
     async def test_stop(self, query_loop) -> None:
         await query_loop.start()
         timed_call = query_loop._timed_calls["q"]
@@ -180,6 +242,8 @@ class TestQueryLoop:
         assert metric_values(queries_metric, by_labels=("status",)) == {
             ("success",): 1.0
         }
+        # successful queries are not tracked for removal
+        assert query_loop._doomed_queries == {}
 
     async def test_run_scheduled_query(
         self,
@@ -313,6 +377,26 @@ class TestQueryLoop:
         assert value == 100.123
         assert isinstance(value, float)
 
+    async def test_update_metric_label_values_as_strings(
+        self,
+        registry: MetricsRegistry,
+        config_data: dict[str, t.Any],
+        make_query_loop: MakeQueryLoop,
+    ) -> None:
+        config_data["metrics"]["m"]["labels"] = ["l"]
+        db = DataBase(DataBaseConfig(name="db", dsn="sqlite://"))
+        query_loop = make_query_loop()
+        # values are equal as keys, but produce different series
+        query_loop._update_metric(db, "m", 10, labels={"l": 1})
+        query_loop._update_metric(db, "m", 20, labels={"l": 1.0})
+        query_loop._update_metric(db, "m", 30, labels={"l": True})
+        metric = registry.get_metric("m")
+        assert metric_values(metric, by_labels=("l",)) == {
+            ("1",): 10.0,
+            ("1.0",): 20.0,
+            ("True",): 30.0,
+        }
+
     async def test_run_query_log(
         self,
         log: StructuredLogCapture,
@@ -345,6 +429,17 @@ class TestQueryLoop:
             ),
         ] <= log.events
 
+    async def test_run_query_log_debug_disabled(
+        self,
+        log: StructuredLogCapture,
+        query_tracker: QueryTracker,
+        query_loop: loop.QueryLoop,
+    ) -> None:
+        query_loop._debug_enabled = False
+        await query_loop.start()
+        await query_tracker.wait_results()
+        assert not log.has("updating metric")
+
     async def test_run_query_log_labels(
         self,
         log: StructuredLogCapture,
@@ -426,10 +521,10 @@ class TestQueryLoop:
         db = query_loop._databases["db"]
         await db.connect()
 
-        async def execute(sql, parameters):
+        async def execute_query(query):
             await asyncio.sleep(1)  # longer than timeout
 
-        db._conn.execute = execute
+        db._conn.execute_query = execute_query
 
         await query_tracker.wait_failures()
         queries_metric = registry.get_metric("queries")
@@ -549,6 +644,22 @@ class TestQueryLoop:
         await query_loop.run_aperiodic_queries()
         assert len(query_tracker.queries) == 2
 
+    async def test_run_aperiodic_queries_already_running(
+        self,
+        query_tracker: QueryTracker,
+        config_data: dict[str, t.Any],
+        make_query_loop: MakeQueryLoop,
+    ) -> None:
+        del config_data["queries"]["q"]["interval"]
+        query_loop = make_query_loop()
+        await asyncio.gather(
+            query_loop.run_aperiodic_queries(),
+            query_loop.run_aperiodic_queries(),
+        )
+        # the query is run once, the second run waits for the first one
+        assert len(query_tracker.queries) == 1
+        assert query_loop._running_queries == {}
+
     async def test_run_aperiodic_queries_invalid_result_count(
         self,
         query_tracker: QueryTracker,
@@ -650,3 +761,42 @@ class TestQueryLoop:
         assert metric_values(queries_metric, by_labels=("l",)) == {
             ("bar",): 20.0,
         }
+
+    async def test_clear_expired_series_then_readded(
+        self,
+        tmp_path: Path,
+        advance_time: AdvanceTime,
+        query_tracker: QueryTracker,
+        config_data: dict[str, t.Any],
+        make_query_loop: MakeQueryLoop,
+        registry: MetricsRegistry,
+    ) -> None:
+        db = tmp_path / "db.sqlite"
+        config_data["databases"]["db"]["dsn"] = f"sqlite:///{db}"
+        config_data["metrics"]["m"].update(
+            {
+                "labels": ["l"],
+                "expiration": 10,
+            }
+        )
+        config_data["queries"]["q"]["sql"] = "SELECT * FROM test"
+        del config_data["queries"]["q"]["interval"]
+
+        await run_queries(
+            db,
+            "CREATE TABLE test (m INTEGER, l TEXT)",
+            'INSERT INTO test VALUES (10, "foo")',
+        )
+        query_loop = make_query_loop()
+        await query_loop.run_aperiodic_queries()
+        await query_tracker.wait_results()
+        await advance_time(20)
+        query_loop.clear_expired_series()
+        queries_metric = registry.get_metric("m")
+        assert metric_values(queries_metric, by_labels=("l",)) == {}
+        await query_loop.run_aperiodic_queries()
+        await query_tracker.wait_results()
+        # the series is created again after being removed
+        assert metric_values(queries_metric, by_labels=("l",)) == {
+            ("foo",): 10.0,
+        }